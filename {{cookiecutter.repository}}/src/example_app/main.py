@@ -1,15 +1,37 @@
 """
 Setup:
-    pip install fastapi uvicorn
+    pip install fastapi "uvicorn[standard]"
 
 Run:
     uvicorn main:app --reload
+
+Serve (uvloop + httptools, no access log, HOST defaults to 127.0.0.1):
+    python -m example_app.main
 """
 
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Response
 
 app = FastAPI()
 
+# Constant payload, encoded once instead of on every request.
+_HELLO = Response(content=b'{"Hello":"World"}', media_type="application/json")
+
+
 @app.get("/")
-def hello_world():
-    return {"Hello": "World"}
\ No newline at end of file
+def hello_world() -> Response:
+    return _HELLO
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "example_app.main:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        workers=os.cpu_count(),
+    )